@@ -1,4 +1,5 @@
 from napari._app_model.constants import CommandId, MenuId
+from napari.utils.translations import TranslationString
 
 
 def test_command_titles():
@@ -6,6 +7,9 @@ def test_command_titles():
     for command in CommandId:
         assert command.value.startswith('napari:')
         assert command.title is not None
+        # translated to a plain str, not the deferred TranslationString
+        assert isinstance(command.command_title, str)
+        assert not isinstance(command.command_title, TranslationString)
 
 
 def test_menus():
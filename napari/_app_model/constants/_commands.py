@@ -1,17 +1,22 @@
 """All commands that are available in the napari GUI are defined here.
 
 Internally, prefer using the CommandId enum instead of the string literal.
-When adding a new command, add a new title/description in the _COMMAND_INFO dict
-below.  The title will be used in the GUI, and the may be used in auto generated
-documentation.
+When adding a new command, add a new title in the _COMMAND_INFO dict below, and
+optionally a description in the _DESCRIPTIONS dict.  The title will be used in
+the GUI, and the may be used in auto generated documentation.
+
+Titles are created with `deferred=True` so that no translation lookups happen
+at import time; they are only translated when `command_title` is accessed.
 
 CommandId values should be namespaced, e.g. 'napari:layer:something' for a command
 that operates on layers.
 """
-from typing import NamedTuple, Optional
+from functools import lru_cache
+from typing import Dict, Union, cast
 
+from napari.utils._base import _DEFAULT_LOCALE
 from napari.utils.compat import StrEnum
-from napari.utils.translations import trans
+from napari.utils.translations import TranslationString, trans
 
 
 # fmt: off
@@ -101,94 +106,112 @@ class CommandId(StrEnum):
 
     @property
     def command_title(self) -> str:
-        return _COMMAND_INFO[self].title
+        # the translated title is stored on the member after the first
+        # access, falling back to the shared `_translate_title` cache
+        title = self.__dict__.get('_title')
+        if title is None:
+            title = self._title = _translate_title(_COMMAND_INFO[self])
+        return title
 
     @property
-    def description(self) -> Optional[str]:
-        return _COMMAND_INFO[self].description
-
-
-class _i(NamedTuple):
-    """simple utility tuple for defining items in _COMMAND_INFO."""
-
-    title: str
-    description: Optional[str] = None
+    def description(self) -> str:
+        return _DESCRIPTIONS.get(self, '')
 
 
-_COMMAND_INFO = {
+_COMMAND_INFO: Dict[CommandId, Union[str, TranslationString]] = {
     # File menubar
-    CommandId.DLG_OPEN_FILES: _i(trans._('Open File(s)...')),
-    CommandId.DLG_OPEN_FILES_AS_STACK: _i(trans._('Open Files as Stack...')),
-    CommandId.DLG_OPEN_FOLDER: _i(trans._('Open Folder...')),
-    CommandId.DLG_OPEN_FILES_WITH_PLUGIN: _i(trans._('Open File(s)...')),
-    CommandId.DLG_OPEN_FILES_AS_STACK_WITH_PLUGIN: _i(trans._('Open Files as Stack...')),
-    CommandId.DLG_OPEN_FOLDER_WITH_PLUGIN: _i(trans._('Open Folder...')),
-    CommandId.DLG_SHOW_PREFERENCES: _i(trans._('Preferences')),
-    CommandId.DLG_SAVE_LAYERS: _i(trans._('Save All Layers...')),
-    CommandId.DLG_SAVE_SELECTED_LAYERS: _i(trans._('Save Selected Layers...')),
-    CommandId.DLG_SAVE_CANVAS_SCREENSHOT: _i(trans._('Save Screenshot...')),
-    CommandId.DLG_SAVE_VIEWER_SCREENSHOT: _i(trans._('Save Screenshot with Viewer...')),
-    CommandId.COPY_CANVAS_SCREENSHOT: _i(trans._('Copy Screenshot to Clipboard')),
-    CommandId.COPY_VIEWER_SCREENSHOT: _i(trans._('Copy Screenshot with Viewer to Clipboard')),
-    CommandId.DLG_CLOSE: _i(trans._('Close Window')),
-    CommandId.DLG_QUIT: _i(trans._('Exit')),
-    CommandId.RESTART: _i(trans._('Restart')),
-    CommandId.IMAGE_FROM_CLIPBOARD: _i(trans._("New Image from Clipboard")),
+    CommandId.DLG_OPEN_FILES: trans._('Open File(s)...', deferred=True),
+    CommandId.DLG_OPEN_FILES_AS_STACK: trans._('Open Files as Stack...', deferred=True),
+    CommandId.DLG_OPEN_FOLDER: trans._('Open Folder...', deferred=True),
+    CommandId.DLG_OPEN_FILES_WITH_PLUGIN: trans._('Open File(s)...', deferred=True),
+    CommandId.DLG_OPEN_FILES_AS_STACK_WITH_PLUGIN: trans._('Open Files as Stack...', deferred=True),
+    CommandId.DLG_OPEN_FOLDER_WITH_PLUGIN: trans._('Open Folder...', deferred=True),
+    CommandId.DLG_SHOW_PREFERENCES: trans._('Preferences', deferred=True),
+    CommandId.DLG_SAVE_LAYERS: trans._('Save All Layers...', deferred=True),
+    CommandId.DLG_SAVE_SELECTED_LAYERS: trans._('Save Selected Layers...', deferred=True),
+    CommandId.DLG_SAVE_CANVAS_SCREENSHOT: trans._('Save Screenshot...', deferred=True),
+    CommandId.DLG_SAVE_VIEWER_SCREENSHOT: trans._('Save Screenshot with Viewer...', deferred=True),
+    CommandId.COPY_CANVAS_SCREENSHOT: trans._('Copy Screenshot to Clipboard', deferred=True),
+    CommandId.COPY_VIEWER_SCREENSHOT: trans._('Copy Screenshot with Viewer to Clipboard', deferred=True),
+    CommandId.DLG_CLOSE: trans._('Close Window', deferred=True),
+    CommandId.DLG_QUIT: trans._('Exit', deferred=True),
+    CommandId.RESTART: trans._('Restart', deferred=True),
+    CommandId.IMAGE_FROM_CLIPBOARD: trans._("New Image from Clipboard", deferred=True),
 
     # View menubar
-    CommandId.TOGGLE_FULLSCREEN: _i(trans._('Toggle Full Screen')),
-    CommandId.TOGGLE_MENUBAR: _i(trans._('Toggle Menubar Visibility')),
-    CommandId.TOGGLE_PLAY: _i(trans._('Toggle Play')),
-    CommandId.TOGGLE_LAYER_TOOLTIPS: _i(trans._('Toggle Layer Tooltips')),
-    CommandId.TOGGLE_ACTIVITY_DOCK: _i(trans._('Toggle Activity Dock')),
-    CommandId.TOGGLE_VIEWER_AXES: _i(trans._('Axes Visible')),
-    CommandId.TOGGLE_VIEWER_AXES_COLORED: _i(trans._('Axes Colored')),
-    CommandId.TOGGLE_VIEWER_AXES_LABELS: _i(trans._('Axes Labels')),
-    CommandId.TOGGLE_VIEWER_AXES_DASHED: _i(trans._('Axes Dashed')),
-    CommandId.TOGGLE_VIEWER_AXES_ARROWS: _i(trans._('Axes Arrows')),
-    CommandId.TOGGLE_VIEWER_SCALE_BAR: _i(trans._('Scale Bar Visible')),
-    CommandId.TOGGLE_VIEWER_SCALE_BAR_COLORED: _i(trans._('Scale Bar Colored')),
-    CommandId.TOGGLE_VIEWER_SCALE_BAR_TICKS: _i(trans._('Scale Bar Ticks')),
+    CommandId.TOGGLE_FULLSCREEN: trans._('Toggle Full Screen', deferred=True),
+    CommandId.TOGGLE_MENUBAR: trans._('Toggle Menubar Visibility', deferred=True),
+    CommandId.TOGGLE_PLAY: trans._('Toggle Play', deferred=True),
+    CommandId.TOGGLE_LAYER_TOOLTIPS: trans._('Toggle Layer Tooltips', deferred=True),
+    CommandId.TOGGLE_ACTIVITY_DOCK: trans._('Toggle Activity Dock', deferred=True),
+    CommandId.TOGGLE_VIEWER_AXES: trans._('Axes Visible', deferred=True),
+    CommandId.TOGGLE_VIEWER_AXES_COLORED: trans._('Axes Colored', deferred=True),
+    CommandId.TOGGLE_VIEWER_AXES_LABELS: trans._('Axes Labels', deferred=True),
+    CommandId.TOGGLE_VIEWER_AXES_DASHED: trans._('Axes Dashed', deferred=True),
+    CommandId.TOGGLE_VIEWER_AXES_ARROWS: trans._('Axes Arrows', deferred=True),
+    CommandId.TOGGLE_VIEWER_SCALE_BAR: trans._('Scale Bar Visible', deferred=True),
+    CommandId.TOGGLE_VIEWER_SCALE_BAR_COLORED: trans._('Scale Bar Colored', deferred=True),
+    CommandId.TOGGLE_VIEWER_SCALE_BAR_TICKS: trans._('Scale Bar Ticks', deferred=True),
 
     # Help menubar
-    CommandId.NAPARI_GETTING_STARTED: _i(trans._('Getting started')),
-    CommandId.NAPARI_TUTORIALS: _i(trans._('Tutorials')),
-    CommandId.NAPARI_LAYERS_GUIDE: _i(trans._('Using Layers Guides')),
-    CommandId.NAPARI_EXAMPLES: _i(trans._('Examples Gallery')),
-    CommandId.NAPARI_RELEASE_NOTES: _i(trans._('Release Notes')),
-    CommandId.NAPARI_HOMEPAGE: _i(trans._('napari homepage')),
-    CommandId.NAPARI_INFO: _i(trans._('napari Info')),
-    CommandId.NAPARI_GITHUB_ISSUE: _i(trans._('Report an issue on GitHub')),
-    CommandId.TOGGLE_BUG_REPORT_OPT_IN: _i(trans._('Bug Reporting Opt In/Out...')),
+    CommandId.NAPARI_GETTING_STARTED: trans._('Getting started', deferred=True),
+    CommandId.NAPARI_TUTORIALS: trans._('Tutorials', deferred=True),
+    CommandId.NAPARI_LAYERS_GUIDE: trans._('Using Layers Guides', deferred=True),
+    CommandId.NAPARI_EXAMPLES: trans._('Examples Gallery', deferred=True),
+    CommandId.NAPARI_RELEASE_NOTES: trans._('Release Notes', deferred=True),
+    CommandId.NAPARI_HOMEPAGE: trans._('napari homepage', deferred=True),
+    CommandId.NAPARI_INFO: trans._('napari Info', deferred=True),
+    CommandId.NAPARI_GITHUB_ISSUE: trans._('Report an issue on GitHub', deferred=True),
+    CommandId.TOGGLE_BUG_REPORT_OPT_IN: trans._('Bug Reporting Opt In/Out...', deferred=True),
 
     # Layer menubar
-    CommandId.LAYER_DUPLICATE: _i(trans._('Duplicate Layer')),
-    CommandId.LAYER_SPLIT_STACK: _i(trans._('Split Stack')),
-    CommandId.LAYER_SPLIT_RGB: _i(trans._('Split RGB')),
-    CommandId.LAYER_MERGE_STACK: _i(trans._('Merge to Stack')),
-    CommandId.LAYER_TOGGLE_VISIBILITY: _i(trans._('Toggle visibility')),
-    CommandId.SHOW_SELECTED_LAYERS: _i(trans._('Show All Selected Layers')),
-    CommandId.HIDE_SELECTED_LAYERS: _i(trans._('Hide All Selected Layers')),
-    CommandId.SHOW_UNSELECTED_LAYERS: _i(trans._('Show All Unselected Layers')),
-    CommandId.HIDE_UNSELECTED_LAYERS: _i(trans._('Hide All Unselected Layers')),
-    CommandId.LAYER_LINK_SELECTED: _i(trans._('Link Layers')),
-    CommandId.LAYER_UNLINK_SELECTED: _i(trans._('Unlink Layers')),
-    CommandId.LAYER_SELECT_LINKED: _i(trans._('Select Linked Layers')),
-    CommandId.LAYER_CONVERT_TO_LABELS: _i(trans._('Convert to Labels')),
-    CommandId.LAYER_CONVERT_TO_IMAGE: _i(trans._('Convert to Image')),
-    CommandId.LAYER_CONVERT_TO_INT8: _i(trans._('Convert to int8')),
-    CommandId.LAYER_CONVERT_TO_INT16: _i(trans._('Convert to int16')),
-    CommandId.LAYER_CONVERT_TO_INT32: _i(trans._('Convert to int32')),
-    CommandId.LAYER_CONVERT_TO_INT64: _i(trans._('Convert to int64')),
-    CommandId.LAYER_CONVERT_TO_UINT8: _i(trans._('Convert to uint8')),
-    CommandId.LAYER_CONVERT_TO_UINT16: _i(trans._('Convert to uint16')),
-    CommandId.LAYER_CONVERT_TO_UINT32: _i(trans._('Convert to uint32')),
-    CommandId.LAYER_CONVERT_TO_UINT64: _i(trans._('Convert to uint64')),
-    CommandId.LAYER_PROJECT_MAX: _i(trans._('Max projection')),
-    CommandId.LAYER_PROJECT_MIN: _i(trans._('Min projection')),
-    CommandId.LAYER_PROJECT_STD: _i(trans._('Std projection')),
-    CommandId.LAYER_PROJECT_SUM: _i(trans._('Sum projection')),
-    CommandId.LAYER_PROJECT_MEAN: _i(trans._('Mean projection')),
-    CommandId.LAYER_PROJECT_MEDIAN: _i(trans._('Median projection')),
+    CommandId.LAYER_DUPLICATE: trans._('Duplicate Layer', deferred=True),
+    CommandId.LAYER_SPLIT_STACK: trans._('Split Stack', deferred=True),
+    CommandId.LAYER_SPLIT_RGB: trans._('Split RGB', deferred=True),
+    CommandId.LAYER_MERGE_STACK: trans._('Merge to Stack', deferred=True),
+    CommandId.LAYER_TOGGLE_VISIBILITY: trans._('Toggle visibility', deferred=True),
+    CommandId.SHOW_SELECTED_LAYERS: trans._('Show All Selected Layers', deferred=True),
+    CommandId.HIDE_SELECTED_LAYERS: trans._('Hide All Selected Layers', deferred=True),
+    CommandId.SHOW_UNSELECTED_LAYERS: trans._('Show All Unselected Layers', deferred=True),
+    CommandId.HIDE_UNSELECTED_LAYERS: trans._('Hide All Unselected Layers', deferred=True),
+    CommandId.LAYER_LINK_SELECTED: trans._('Link Layers', deferred=True),
+    CommandId.LAYER_UNLINK_SELECTED: trans._('Unlink Layers', deferred=True),
+    CommandId.LAYER_SELECT_LINKED: trans._('Select Linked Layers', deferred=True),
+    CommandId.LAYER_CONVERT_TO_LABELS: trans._('Convert to Labels', deferred=True),
+    CommandId.LAYER_CONVERT_TO_IMAGE: trans._('Convert to Image', deferred=True),
+    CommandId.LAYER_CONVERT_TO_INT8: trans._('Convert to int8', deferred=True),
+    CommandId.LAYER_CONVERT_TO_INT16: trans._('Convert to int16', deferred=True),
+    CommandId.LAYER_CONVERT_TO_INT32: trans._('Convert to int32', deferred=True),
+    CommandId.LAYER_CONVERT_TO_INT64: trans._('Convert to int64', deferred=True),
+    CommandId.LAYER_CONVERT_TO_UINT8: trans._('Convert to uint8', deferred=True),
+    CommandId.LAYER_CONVERT_TO_UINT16: trans._('Convert to uint16', deferred=True),
+    CommandId.LAYER_CONVERT_TO_UINT32: trans._('Convert to uint32', deferred=True),
+    CommandId.LAYER_CONVERT_TO_UINT64: trans._('Convert to uint64', deferred=True),
+    CommandId.LAYER_PROJECT_MAX: trans._('Max projection', deferred=True),
+    CommandId.LAYER_PROJECT_MIN: trans._('Min projection', deferred=True),
+    CommandId.LAYER_PROJECT_STD: trans._('Std projection', deferred=True),
+    CommandId.LAYER_PROJECT_SUM: trans._('Sum projection', deferred=True),
+    CommandId.LAYER_PROJECT_MEAN: trans._('Mean projection', deferred=True),
+    CommandId.LAYER_PROJECT_MEDIAN: trans._('Median projection', deferred=True),
 }
+
+# Only commands that have a description need an entry here.
+_DESCRIPTIONS: Dict[CommandId, str] = {}
 # fmt: on
+
+
+@lru_cache(maxsize=None)
+def _translate_title(title: Union[str, TranslationString]) -> str:
+    """Translate `title`, only once per session.
+
+    The cache is keyed on the source string, so commands sharing a title
+    (e.g. the "with plugin" variants of the open dialogs) share a single
+    translation lookup and the same resulting string object.
+    """
+    # titles are created with `deferred=True`, so they are always
+    # TranslationStrings, even though `trans._` is typed as returning either
+    title = cast(TranslationString, title)
+    if trans._locale.split('_')[0] == _DEFAULT_LOCALE:
+        # source strings are English, no need to go through gettext
+        return title.value()
+    return title.translation()
@@ -7,6 +7,7 @@ from napari._tests.utils import check_layer_world_data_extent
 from napari.components.dims import Dims
 from napari.layers import Image
 from napari.layers.image._image_constants import ImageRendering
+from napari.layers.image.image import _nearest_neighbor_indices
 from napari.layers.utils.plane import ClippingPlaneList, SlicingPlane
 from napari.utils import Colormap
 from napari.utils.transforms.transform_utils import rotate_to_matrix
@@ -229,6 +230,7 @@ def test_changing_image():
     layer.data = data_b
     assert np.array_equal(layer.data, data_b)
     assert layer.ndim == len(shape_b)
+    np.testing.assert_array_equal(layer.level_shapes, [shape_b])
     np.testing.assert_array_equal(
         layer.extent.data[1], [s - 1 for s in shape_b]
     )
@@ -628,6 +630,29 @@ def test_narrow_thumbnail():
     assert np.mean(thumbnail[middle_row - 1 : middle_row + 1]) > 0
 
 
+@pytest.mark.parametrize('shape', [(5, 70, 45), (5, 70, 45, 3)])
+def test_thumbnail_3d_is_max_projection(shape):
+    """The 3D thumbnail matches the thumbnail of the max projection."""
+    np.random.seed(0)
+    data = np.random.random(shape)
+    layer = Image(data, contrast_limits=(0, 1))
+    layer._slice_dims(Dims(ndim=3, ndisplay=3))
+    layer._update_thumbnail()
+    projected = Image(data.max(axis=0), contrast_limits=(0, 1))
+    projected._update_thumbnail()
+    np.testing.assert_array_equal(layer.thumbnail, projected.thumbnail)
+
+
+@pytest.mark.parametrize(
+    ('size', 'new_size', 'expected'),
+    [(1, 3, [0, 0, 0]), (10, 1, [0]), (10, 4, [0, 3, 6, 9]), (5, 5, range(5))],
+)
+def test_nearest_neighbor_indices(size, new_size, expected):
+    np.testing.assert_array_equal(
+        _nearest_neighbor_indices(size, new_size), expected
+    )
+
+
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_out_of_range_image(dtype):
     data = -1.7 - 0.001 * np.random.random((10, 15)).astype(dtype)
@@ -826,6 +851,19 @@ def test_instantiate_with_experimental_clipping_planes_dict():
         )
 
 
+def test_custom_interpolation_kernel_2d():
+    kernel = np.ones((3, 3), dtype=np.float32)
+    image = Image(np.ones((32, 32)), custom_interpolation_kernel_2d=kernel)
+    assert image.custom_interpolation_kernel_2d.dtype == np.float32
+    np.testing.assert_array_equal(image.custom_interpolation_kernel_2d, kernel)
+
+    image.custom_interpolation_kernel_2d = None
+    np.testing.assert_array_equal(image.custom_interpolation_kernel_2d, [[1]])
+
+    with pytest.raises(ValueError, match='must be 2 dimensional'):
+        image.custom_interpolation_kernel_2d = [1, 2, 1]
+
+
 def test_tensorstore_image():
     """Test an image coming from a tensorstore array."""
     ts = pytest.importorskip('tensorstore')
@@ -948,6 +986,17 @@ def test_thick_slice():
     )
 
 
+@pytest.mark.parametrize(
+    ('translate', 'expected_point'), [((0, 0, 0), 3), ((1, 0, 0), 2)]
+)
+def test_make_slice_request_data_slice(translate, expected_point):
+    layer = Image(np.zeros((5, 5, 5)), translate=translate)
+    request = layer._make_slice_request(
+        Dims(ndim=3, range=((0, 4, 1),) * 3, point=(3, 0, 0))
+    )
+    assert request.data_slice.point[0] == expected_point
+
+
 def test_thick_slice_multiscale():
     data = np.ones((5, 5, 5)) * np.arange(5).reshape(-1, 1, 1)
     data_zoom = data.repeat(2, 0).repeat(2, 1).repeat(2, 2)
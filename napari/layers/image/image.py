@@ -6,10 +6,17 @@ import types
 import warnings
 from abc import ABC
 from contextlib import nullcontext
-from typing import TYPE_CHECKING, List, Sequence, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-from scipy import ndimage as ndi
 
 from napari.layers._data_protocols import LayerDataProtocol
 from napari.layers._multiscale_data import MultiScaleData
@@ -47,6 +54,32 @@ if TYPE_CHECKING:
     from napari.components import Dims
 
 
+# offsets from pixel centers to pixel edges, to augment a (2, D) extent
+_PIXEL_EXTENT_OFFSET = np.array([[-0.5], [0.5]])
+
+
+def _extent_from_shape(shape: npt.NDArray) -> npt.NDArray:
+    """(2, D) extent, in data coordinates, of an array of the given shape."""
+    # a single allocation, instead of building zeros and stacking them
+    extent = np.zeros((2, len(shape)))
+    extent[1] = shape
+    extent[1] -= 1
+    return extent
+
+
+def _nearest_neighbor_indices(size: int, new_size: int) -> npt.NDArray:
+    """Indices sampled along an axis of length size to resize it to new_size.
+
+    This is the sampling of ``scipy.ndimage.zoom(..., order=0)``, without
+    its interpolation machinery, so that the indices can be used to
+    downsample with a single fancy-indexing gather.
+    """
+    if new_size == 1:
+        return np.zeros(1, dtype=np.intp)
+    coords = np.arange(new_size) * ((size - 1) / (new_size - 1))
+    return np.floor(coords + 0.5).astype(np.intp)
+
+
 # It is important to contain at least one abstractmethod to properly exclude this class
 # in creating NAMES set inside of napari.layers.__init__
 # Mixin must come before Layer
@@ -261,30 +294,37 @@ class _ImageBase(Layer, ABC):
 
         # Set data
         self._data = data
+        # level shapes and downsample factors, computed on first access
+        self._level_shapes: Optional[np.ndarray] = None
+        self._downsample_factors: Optional[np.ndarray] = None
+        # Whether the last data axis holds color channels. Replacing the
+        # data keeps this unchanged, as ndim is then derived from the
+        # level shapes, which already exclude the channel axis.
+        self._is_rgb = len(data.shape) != self.ndim
         if isinstance(data, MultiScaleData):
             self._data_level = len(data) - 1
             # Determine which level of the multiscale to use for the thumbnail.
             # Pick the smallest level with at least one axis >= 64. This is
             # done to prevent the thumbnail from being from one of the very
             # low resolution layers and therefore being very blurred.
-            big_enough_levels = [
-                np.any(np.greater_equal(p.shape, 64)) for p in data
-            ]
-            if np.any(big_enough_levels):
-                self._thumbnail_level = np.where(big_enough_levels)[0][-1]
+            big_enough_levels = np.flatnonzero(
+                self.level_shapes.max(axis=1) >= 64
+            )
+            if big_enough_levels.size:
+                self._thumbnail_level = int(big_enough_levels[-1])
             else:
                 self._thumbnail_level = 0
         else:
             self._data_level = 0
             self._thumbnail_level = 0
         displayed_axes = self._slice_input.displayed
-        self.corner_pixels[1][displayed_axes] = (
-            np.array(self.level_shapes)[self._data_level][displayed_axes] - 1
+        self.corner_pixels[1, displayed_axes] = (
+            self.level_shapes[self._data_level, displayed_axes] - 1
         )
 
         self._slice = _ImageSliceResponse.make_empty(
             slice_input=self._slice_input,
-            rgb=len(self.data.shape) != self.ndim,
+            rgb=self._is_rgb,
         )
 
         self._plane = SlicingPlane(thickness=1)
@@ -334,13 +374,14 @@ class _ImageBase(Layer, ABC):
         -------
         extent_data : array, shape (2, D)
         """
-        shape = self.level_shapes[0]
-        return np.vstack([np.zeros(len(shape)), shape - 1])
+        return _extent_from_shape(self.level_shapes[0])
 
     @property
     def _extent_data_augmented(self) -> np.ndarray:
         extent = self._extent_data
-        return extent + [[-0.5], [+0.5]]
+        # _extent_data is a fresh array, so it can be offset in place
+        extent += _PIXEL_EXTENT_OFFSET
+        return extent
 
     @property
     def _extent_level_data(self) -> np.ndarray:
@@ -350,13 +391,13 @@ class _ImageBase(Layer, ABC):
         -------
         extent_data : array, shape (2, D)
         """
-        shape = self.level_shapes[self.data_level]
-        return np.vstack([np.zeros(len(shape)), shape - 1])
+        return _extent_from_shape(self.level_shapes[self.data_level])
 
     @property
     def _extent_level_data_augmented(self) -> np.ndarray:
         extent = self._extent_level_data
-        return extent + [[-0.5], [+0.5]]
+        extent += _PIXEL_EXTENT_OFFSET
+        return extent
 
     @property
     def data_level(self) -> int:
@@ -370,23 +411,39 @@ class _ImageBase(Layer, ABC):
         self._data_level = level
         self.refresh()
 
-    def _get_level_shapes(self):
+    def _get_level_shapes(self) -> np.ndarray:
         data = self.data
         if isinstance(data, MultiScaleData):
-            shapes = data.shapes
-        else:
-            shapes = [self.data.shape]
-        return shapes
+            return np.array(data.shapes, dtype=np.int64)
+        return np.array(data.shape, dtype=np.int64).reshape(1, -1)
 
     @property
     def level_shapes(self) -> np.ndarray:
         """array: Shapes of each level of the multiscale or just of image."""
-        return np.array(self._get_level_shapes())
+        # cached, as this is used on every slice request and extent update
+        if self._level_shapes is None:
+            level_shapes = self._get_level_shapes()
+            level_shapes.flags.writeable = False
+            self._level_shapes = level_shapes
+        return self._level_shapes
 
     @property
     def downsample_factors(self) -> np.ndarray:
         """list: Downsample factors for each level of the multiscale."""
-        return np.divide(self.level_shapes[0], self.level_shapes)
+        if self._downsample_factors is None:
+            level_shapes = self.level_shapes
+            downsample_factors = np.divide(level_shapes[0], level_shapes)
+            downsample_factors.flags.writeable = False
+            self._downsample_factors = downsample_factors
+        return self._downsample_factors
+
+    def _clear_level_shapes(self) -> None:
+        """Clear cached level shapes and downsample factors.
+
+        Must be called whenever the data is replaced.
+        """
+        self._level_shapes = None
+        self._downsample_factors = None
 
     @property
     def depiction(self):
@@ -409,7 +466,7 @@ class _ImageBase(Layer, ABC):
 
     def _reset_plane_parameters(self):
         """Set plane attributes to something valid."""
-        self.plane.position = np.array(self.data.shape) / 2
+        self.plane.position = np.multiply(self.data.shape, 0.5)
         self.plane.normal = (1, 0, 0)
 
     def _update_plane_callbacks(self):
@@ -452,7 +509,17 @@ class _ImageBase(Layer, ABC):
     def custom_interpolation_kernel_2d(self, value):
         if value is None:
             value = [[1]]
-        self._custom_interpolation_kernel_2d = np.array(value, np.float32)
+        # avoid a copy when given a compatible array already
+        kernel = np.ascontiguousarray(value, dtype=np.float32)
+        if kernel.ndim != 2:
+            raise ValueError(
+                trans._(
+                    'custom_interpolation_kernel_2d must be 2 dimensional, got {ndim} dimensions.',
+                    deferred=True,
+                    ndim=kernel.ndim,
+                )
+            )
+        self._custom_interpolation_kernel_2d = kernel
         self.events.custom_interpolation_kernel_2d()
 
     def _raw_to_displayed(self, raw):
@@ -495,7 +562,14 @@ class _ImageBase(Layer, ABC):
         # absorbs these performance issues here, but we can likely improve
         # things either by caching the world-to-data transform on the layer
         # or by lazily evaluating it in the slice task itself.
-        indices = slice_input.data_slice(self._data_to_world.inverse)
+        data_to_world = self._data_to_world
+        affine_matrix = data_to_world.affine_matrix
+        if np.array_equal(affine_matrix, np.eye(len(affine_matrix))):
+            # no transform, so no need to invert it and map the slice
+            world_to_data = None
+        else:
+            world_to_data = data_to_world.inverse
+        indices = slice_input.data_slice(world_to_data)
         return self._make_slice_request_internal(
             slice_input=slice_input,
             data_slice=indices,
@@ -523,7 +597,7 @@ class _ImageBase(Layer, ABC):
             projection_mode=self.projection_mode,
             multiscale=self.multiscale,
             corner_pixels=self.corner_pixels,
-            rgb=len(self.data.shape) != self.ndim,
+            rgb=self._is_rgb,
             data_level=self.data_level,
             thumbnail_level=self._thumbnail_level,
             level_shapes=self.level_shapes,
@@ -551,33 +625,35 @@ class _ImageBase(Layer, ABC):
         value : tuple
             Value of the data.
         """
-        if self.multiscale:
+        multiscale = self.multiscale
+        displayed = self._slice_input.displayed
+        if multiscale:
             # for multiscale data map the coordinate from the data back to
             # the tile
             coord = self._transforms['tile2data'].inverse(position)
         else:
             coord = position
 
-        coord = np.round(coord).astype(int)
+        coord = np.asarray(coord)
+        if not np.issubdtype(coord.dtype, np.integer):
+            coord = np.rint(coord).astype(np.intp)
 
         raw = self._slice.image.raw
-        shape = (
-            raw.shape[:-1] if self.ndim != len(self._data.shape) else raw.shape
-        )
+        shape = raw.shape[:-1] if self._is_rgb else raw.shape
 
         if self.ndim < len(coord):
             # handle 3D views of 2D data by omitting extra coordinate
             offset = len(coord) - len(shape)
-            coord = coord[[d + offset for d in self._slice_input.displayed]]
+            coord = coord[[d + offset for d in displayed]]
         else:
-            coord = coord[self._slice_input.displayed]
+            coord = coord[displayed]
 
-        if all(0 <= c < s for c, s in zip(coord, shape)):
-            value = raw[tuple(coord)]
+        if np.all((coord >= 0) & (coord < shape)):
+            value = raw[tuple(coord.tolist())]
         else:
             value = None
 
-        if self.multiscale:
+        if multiscale:
             value = (self.data_level, value)
 
         return value
@@ -596,8 +672,7 @@ class _ImageBase(Layer, ABC):
         self, dims_displayed: List[int], data_level: int
     ) -> npt.NDArray:
         """An axis aligned (ndisplay, 2) bounding box around the data at a given level"""
-        shape = self.level_shapes[data_level]
-        extent_at_level = np.vstack([np.zeros(len(shape)), shape - 1])
+        extent_at_level = _extent_from_shape(self.level_shapes[data_level])
         return extent_at_level[:, dims_displayed].T
 
     def _display_bounding_box_augmented_data_level(
@@ -864,7 +939,6 @@ class Image(IntensityVisualizationMixin, _ImageBase):
             visible=visible,
         )
 
-        self.rgb = rgb
         self._colormap = ensure_colormap(colormap)
         self._gamma = gamma
         self._interpolation2d = Interpolation.NEAREST
@@ -886,8 +960,7 @@ class Image(IntensityVisualizationMixin, _ImageBase):
                 self.contrast_limits_range = self._calc_data_range()
         else:
             self.contrast_limits_range = contrast_limits
-        self._contrast_limits: Tuple[float, float] = self.contrast_limits_range
-        self.contrast_limits = self._contrast_limits
+        self.contrast_limits = self.contrast_limits_range
 
         if iso_threshold is None:
             cmin, cmax = self.contrast_limits_range
@@ -980,7 +1053,6 @@ class Image(IntensityVisualizationMixin, _ImageBase):
     @attenuation.setter
     def attenuation(self, value: float):
         self._attenuation = value
-        self._update_thumbnail()
         self.events.attenuation()
 
     @property
@@ -993,6 +1065,7 @@ class Image(IntensityVisualizationMixin, _ImageBase):
         self._data_raw = data
         # note, we don't support changing multiscale in an Image instance
         self._data = MultiScaleData(data) if self.multiscale else data  # type: ignore
+        self._clear_level_shapes()
         self._update_dims()
         self.events.data(value=self.data)
         if self._keep_auto_contrast:
@@ -1108,65 +1181,79 @@ class Image(IntensityVisualizationMixin, _ImageBase):
     @iso_threshold.setter
     def iso_threshold(self, value: float):
         self._iso_threshold = value
-        self._update_thumbnail()
         self.events.iso_threshold()
 
-    def _get_level_shapes(self):
+    def _get_level_shapes(self) -> np.ndarray:
         shapes = super()._get_level_shapes()
         if self.rgb:
-            shapes = [s[:-1] for s in shapes]
+            shapes = shapes[:, :-1]
         return shapes
 
     def _update_thumbnail(self):
         """Update thumbnail with current image data and colormap."""
         image = self._slice.thumbnail.view
 
-        if self._slice_input.ndisplay == 3 and self.ndim > 2:
-            image = np.max(image, axis=0)
-
-        # float16 not supported by ndi.zoom
-        dtype = np.dtype(image.dtype)
-        if dtype in [np.dtype(np.float16)]:
-            image = image.astype(np.float32)
-
-        raw_zoom_factor = np.divide(
-            self._thumbnail_shape[:2], image.shape[:2]
-        ).min()
-        new_shape = np.clip(
-            raw_zoom_factor * np.array(image.shape[:2]),
-            1,  # smallest side should be 1 pixel wide
-            self._thumbnail_shape[:2],
+        # In 3D the thumbnail is a max projection along the first axis.
+        # A nearest-neighbor zoom picks the same rows and columns from every
+        # plane, so the projection is taken after downsampling, over the
+        # picked pixels only, rather than over the full volume.
+        project = self._slice_input.ndisplay == 3 and self.ndim > 2
+        plane_shape = image.shape[1:3] if project else image.shape[:2]
+
+        # plain scalar math, as these are only ever two numbers
+        thumbnail_shape = self._thumbnail_shape[:2]
+        zoom_factor = min(
+            max_size / size
+            for max_size, size in zip(thumbnail_shape, plane_shape)
         )
-        zoom_factor = tuple(new_shape / image.shape[:2])
-        if self.rgb:
-            downsampled = ndi.zoom(
-                image, zoom_factor + (1,), prefilter=False, order=0
+        rows, cols = (
+            _nearest_neighbor_indices(
+                size,
+                # smallest side should be 1 pixel wide
+                int(round(min(max(zoom_factor * size, 1), max_size))),
             )
-            if image.shape[2] == 4:  # image is RGBA
-                colormapped = np.copy(downsampled)
+            for max_size, size in zip(thumbnail_shape, plane_shape)
+        )
+        if self.rgb:
+            downsampled = image[..., rows[:, None], cols, :]
+            if project:
+                downsampled = np.max(downsampled, axis=0)
+            if downsampled.dtype == np.float16:
+                # upcast only the downsampled pixels, not the whole view
+                downsampled = downsampled.astype(np.float32)
+            if image.shape[-1] == 4:  # image is RGBA
+                # indexing returned a copy, so alpha can be scaled in place
+                colormapped = downsampled
                 colormapped[..., 3] = downsampled[..., 3] * self.opacity
-                if downsampled.dtype == np.uint8:
-                    colormapped = colormapped.astype(np.uint8)
             else:  # image is RGB
                 if downsampled.dtype == np.uint8:
-                    alpha = np.full(
-                        downsampled.shape[:2] + (1,),
-                        int(255 * self.opacity),
-                        dtype=np.uint8,
-                    )
+                    alpha = int(255 * self.opacity)
+                    dtype = np.dtype(np.uint8)
                 else:
-                    alpha = np.full(downsampled.shape[:2] + (1,), self.opacity)
-                colormapped = np.concatenate([downsampled, alpha], axis=2)
+                    alpha = self.opacity
+                    dtype = np.promote_types(downsampled.dtype, np.float64)
+                # fill the RGBA array directly, rather than building an
+                # alpha array and concatenating it
+                colormapped = np.empty(downsampled.shape[:2] + (4,), dtype)
+                colormapped[..., :3] = downsampled
+                colormapped[..., 3] = alpha
         else:
-            downsampled = ndi.zoom(
-                image, zoom_factor, prefilter=False, order=0
+            downsampled = image[..., rows[:, None], cols]
+            if project:
+                downsampled = np.max(downsampled, axis=0)
+            # indexing returns a fresh array, so once it is floating point the
+            # clip/normalize/gamma passes can all reuse the same buffer
+            downsampled = downsampled.astype(
+                np.result_type(downsampled.dtype, np.float32), copy=False
             )
             low, high = self.contrast_limits
-            downsampled = np.clip(downsampled, low, high)
+            np.clip(downsampled, low, high, out=downsampled)
             color_range = high - low
             if color_range != 0:
-                downsampled = (downsampled - low) / color_range
-            downsampled = downsampled**self.gamma
+                downsampled -= low
+                downsampled /= color_range
+            if self.gamma != 1:
+                np.power(downsampled, self.gamma, out=downsampled)
             color_array = self.colormap.map(downsampled.ravel())
             colormapped = color_array.reshape((*downsampled.shape, 4))
             colormapped[..., 3] *= self.opacity
@@ -597,6 +597,7 @@ class Labels(_ImageBase):
     def data(self, data: Union[LayerDataProtocol, MultiScaleData]):
         data = self._ensure_int_labels(data)
         self._data = data
+        self._clear_level_shapes()
         self._ndim = len(self._data.shape)
         self._update_dims()
         self.events.data(value=self.data)
@@ -2,7 +2,15 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, List, Tuple, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 
@@ -178,27 +186,31 @@ class _SliceInput:
 
     def data_slice(
         self,
-        world_to_data: Affine,
+        world_to_data: Optional[Affine],
     ) -> _ThickNDSlice[Union[float, int]]:
         """Transforms this thick_slice into data coordinates with only relevant dimensions.
 
         The elements in non-displayed dimensions will be real numbers.
         The elements in displayed dimensions will be ``slice(None)``.
+        If ``world_to_data`` is None, it is taken to be the identity.
         """
-        if not self.is_orthogonal(world_to_data):
-            warnings.warn(
-                trans._(
-                    'Non-orthogonal slicing is being requested, but is not fully supported. '
-                    'Data is displayed without applying an out-of-slice rotation or shear component.',
-                    deferred=True,
-                ),
-                category=UserWarning,
-            )
-
-        slice_world_to_data = world_to_data.set_slice(self.not_displayed)
         world_slice_not_disp = self.world_slice[self.not_displayed].as_array()
 
-        data_slice = slice_world_to_data(world_slice_not_disp)
+        if world_to_data is None:
+            data_slice = world_slice_not_disp
+        else:
+            if not self.is_orthogonal(world_to_data):
+                warnings.warn(
+                    trans._(
+                        'Non-orthogonal slicing is being requested, but is not fully supported. '
+                        'Data is displayed without applying an out-of-slice rotation or shear component.',
+                        deferred=True,
+                    ),
+                    category=UserWarning,
+                )
+
+            slice_world_to_data = world_to_data.set_slice(self.not_displayed)
+            data_slice = slice_world_to_data(world_slice_not_disp)
 
         full_data_slice = np.full((3, self.ndim), np.nan)
 
@@ -72,6 +72,17 @@ def test_calc_data_range():
     np.testing.assert_array_equal(clim, (0, 2))
 
 
+@pytest.mark.parametrize('array_type', [np.asarray, da.from_array])
+def test_calc_data_range_nonfinite(array_type):
+    data = np.random.random((10, 15))
+    data[0, 0] = 0
+    data[0, 1] = 2
+    data[1, 0] = np.nan
+    data[1, 1] = -np.inf
+    clim = calc_data_range(array_type(data))
+    np.testing.assert_array_equal(clim, (0, 2))
+
+
 @pytest.mark.parametrize(
     'data',
     [data_dask_8b, data_dask, data_dask_1d, data_dask_1d_rgb, data_dask_plane],
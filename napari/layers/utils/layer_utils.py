@@ -17,6 +17,7 @@ from typing import (
 )
 
 import dask
+import dask.array as da
 import numpy as np
 import pandas as pd
 
@@ -207,6 +208,22 @@ def _nanmax(array):
     return max_value
 
 
+def _nanminmax(array):
+    """
+    call np.min and np.max, reading lazy arrays only once, but fall back to
+    _nanmin and _nanmax to avoid nan and inf if necessary
+    """
+    if isinstance(array, da.Array):
+        # a single compute shares the chunk loads between both reductions
+        min_value, max_value = dask.compute(np.min(array), np.max(array))
+    else:
+        array = np.asarray(array)
+        min_value, max_value = np.min(array), np.max(array)
+    if not (np.isfinite(min_value) and np.isfinite(max_value)):
+        return _nanmin(array), _nanmax(array)
+    return min_value, max_value
+
+
 def calc_data_range(
     data: LayerDataProtocol, rgb: bool = False
 ) -> Tuple[float, float]:
@@ -242,10 +259,7 @@ def calc_data_range(
             slice(center - 2048, center + 2048),
             slice(-4096, None),
         ]
-        reduced_data = [
-            [_nanmax(data[sl]) for sl in slices],
-            [_nanmin(data[sl]) for sl in slices],
-        ]
+        reduced_data = [_nanminmax(data[sl]) for sl in slices]
     elif data.size > 1e7:
         # If data is very large take the average of the top, bottom, and
         # middle slices
@@ -264,21 +278,14 @@ def calc_data_range(
             center = [int(s // 2) for s in data.shape[-offset:]]
             central_slice = tuple(slice(c - 31, c + 31) for c in center[:2])
             reduced_data = [
-                [_nanmax(data[idx + central_slice]) for idx in idxs],
-                [_nanmin(data[idx + central_slice]) for idx in idxs],
+                _nanminmax(data[idx + central_slice]) for idx in idxs
             ]
         else:
-            reduced_data = [
-                [_nanmax(data[idx]) for idx in idxs],
-                [_nanmin(data[idx]) for idx in idxs],
-            ]
-        # compute everything in one go
-        reduced_data = dask.compute(*reduced_data)
+            reduced_data = [_nanminmax(data[idx]) for idx in idxs]
     else:
         reduced_data = data
 
-    min_val = _nanmin(reduced_data)
-    max_val = _nanmax(reduced_data)
+    min_val, max_val = _nanminmax(reduced_data)
 
     if min_val == max_val:
         min_val = 0